@@ -13,7 +13,8 @@ Example .env file:
 """
 
 import os
-from typing import List
+from functools import cached_property
+from typing import Tuple
 from pydantic import Field
 from pydantic_settings import BaseSettings
 
@@ -81,15 +82,22 @@ class Settings(BaseSettings):
         description="Number of requests allowed per minute"
     )
     
+    # Response caching
+    response_cache_size: int = Field(
+        default=256,
+        ge=0,
+        description="Number of seeded /market responses and built markets to keep in memory (0 disables caching)"
+    )
+    
     # CORS settings
-    cors_origins: List[str] = Field(
-        default_factory=lambda: [
+    cors_origins: Tuple[str, ...] = Field(
+        default=(
             "http://localhost:5173",
             "http://127.0.0.1:5173",
             "http://localhost:3000",
             "http://127.0.0.1:3000",
             "https://mkt-env.vercel.app"  # Added your Vercel URL here!
-        ],
+        ),
         description="Allowed CORS origins"
     )
     
@@ -115,12 +123,13 @@ class Settings(BaseSettings):
         "case_sensitive": False
     }
     
-    @property
+    # Derived values are computed once on first access and then reused
+    @cached_property
     def is_development(self) -> bool:
         """Check if running in development environment."""
         return self.environment.lower() == "development"
     
-    @property
+    @cached_property
     def is_production(self) -> bool:
         """Check if running in production environment."""
         return self.environment.lower() == "production"
@@ -137,12 +146,15 @@ class Settings(BaseSettings):
         """Get the effective port, preferring Railway's PORT if available."""
         return self.port  # Already handles PORT environment variable
     
-    def get_cors_origins(self) -> List[str]:
+    @cached_property
+    def cors_origins_effective(self) -> Tuple[str, ...]:
+        """CORS origins for the current environment (computed once)."""
+        # Every environment currently uses all configured origins
+        return tuple(self.cors_origins)
+    
+    def get_cors_origins(self) -> Tuple[str, ...]:
         """Get CORS origins based on environment."""
-        if self.is_production:
-            # In production, include all configured origins
-            return self.cors_origins
-        return self.cors_origins
+        return self.cors_origins_effective
 
 
 # Create global settings instance
@@ -7,7 +7,7 @@ It provides endpoints for:
 - Market simulation (/market) with support for segmented inputs
 
 Setup instructions:
-1. Install dependencies: pip install fastapi uvicorn "pydantic>=2" slowapi
+1. Install dependencies: pip install fastapi uvicorn "pydantic>=2" slowapi orjson numpy
 2. Run the server: python -m uvicorn backend.main:app --reload --port 8001
 3. Test with curl:
    curl -X POST http://127.0.0.1:8001/market \
@@ -35,16 +35,20 @@ Interactive docs at http://127.0.0.1:8001/docs
 
 import logging
 import time
+from functools import lru_cache
 from typing import Dict, Any
+
+import orjson
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import JSONResponse, Response
 from slowapi import Limiter, _rate_limit_exceeded_handler
-from slowapi.util import get_remote_address
 from slowapi.errors import RateLimitExceeded
 
-from .models import MarketParams, MarketResponse, HealthResponse, PricePoint, Equilibrium, Surplus
+from .models import MarketParams, MarketResponse, HealthResponse
 from .market import (
-    build_buyers_and_sellers, find_equilibrium, create_schedule_table, compute_total_surplus_max
+    build_buyers_and_sellers, solve_market, create_schedule_arrays
 )
 from .config import settings
 
@@ -55,24 +59,54 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# Set up rate limiting
-limiter = Limiter(key_func=get_remote_address)
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson.
+
+    The market schedules are long lists of integers, which orjson encodes
+    several times faster than the stdlib json module.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content)
+
+
+# Local development frontends on any port
+_LOCAL_ORIGIN_REGEX = r"http://(localhost|127\.0\.0\.1)(:\d+)?"
+
+
+def _client_host(request: Request) -> str:
+    """Rate-limit key: the client address, read straight from the ASGI scope.
+    
+    Same result as slowapi's get_remote_address without building the
+    Address tuple twice per request.
+    """
+    client = request.scope.get("client")
+    return client[0] if client and client[0] else "127.0.0.1"
+
+
+# Set up rate limiting. The limit is a plain string so slowapi parses it once
+# when the route is decorated (callable limits are re-parsed on every request).
+_MARKET_RATE_LIMIT = f"{settings.rate_limit_requests}/minute"
+limiter = Limiter(key_func=_client_host)
 
 # Create FastAPI app
 app = FastAPI(
     title="Market Simulation API",
     description="A simple supply and demand market simulation API with support for segmented markets",
-    version="2.1.0"
+    version="2.1.0",
+    default_response_class=ORJSONResponse
 )
 
 # Add rate limiter to app state
 app.state.limiter = limiter
 app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
 
-# Add CORS middleware - temporarily allow all origins for debugging
+# Add CORS middleware for the configured frontend origins
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # Allow all origins temporarily
+    allow_origins=settings.cors_origins_effective,
+    allow_origin_regex=None if settings.is_production else _LOCAL_ORIGIN_REGEX,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
@@ -95,12 +129,12 @@ async def health_check():
             details={"market_logic_test": "passed", "test_equilibrium": test_eq}
         )
     except Exception as e:
-        logger.error(f"Health check failed: {str(e)}", exc_info=True)
+        logger.error("Health check failed: %s", e, exc_info=True)
         return HealthResponse(status="degraded", details={"error": str(e)})
 
 
-@app.post("/market", response_model=MarketResponse, tags=["simulation"])
-@limiter.limit("30/minute")  # Allow 30 requests per minute
+@app.post("/market", response_model=MarketResponse, response_class=ORJSONResponse, tags=["simulation"])
+@limiter.limit(_MARKET_RATE_LIMIT)
 async def simulate_market(request: Request, params: MarketParams):
     """Simulate a market with the given parameters.
     
@@ -111,73 +145,45 @@ async def simulate_market(request: Request, params: MarketParams):
     Supports both legacy simple parameters and new segmented parameters.
     When segments are provided, they take precedence over simple parameters.
     """
-    start_time = time.time()
-    
-    # Log incoming request details
-    total_buyers = (
-        sum(seg.n for seg in params.buyer_segments) if params.buyer_segments 
-        else params.num_buyers
-    )
-    total_sellers = (
-        sum(seg.n for seg in params.seller_segments) if params.seller_segments 
-        else params.num_sellers
-    )
+    start_time = time.perf_counter()
     
-    logger.info(
-        f"Market simulation requested - Buyers: {total_buyers}, "
-        f"Sellers: {total_sellers}, Seed: {params.seed}, "
-        f"Using segments: {bool(params.buyer_segments or params.seller_segments)}"
-    )
-    
-    try:
-        # Build buyers and sellers using the new segmented logic
-        buyers_sorted, sellers_sorted = build_buyers_and_sellers(params)
-        logger.debug(f"Generated {len(buyers_sorted)} buyers, {len(sellers_sorted)} sellers")
-        
-        # Find equilibrium
-        eq_quantity, eq_price = find_equilibrium(buyers_sorted, sellers_sorted)
-        equilibrium = Equilibrium(quantity=eq_quantity, price=eq_price)
-        
-        # Calculate maximum total surplus
-        total_surplus = compute_total_surplus_max(buyers_sorted, sellers_sorted, eq_quantity)
-        surplus = Surplus(total_max=total_surplus)
-        
-        # Create schedule tables
-        demand_schedule = [PricePoint(q=point["q"], p=point["p"]) 
-                          for point in create_schedule_table(buyers_sorted)]
-        supply_schedule = [PricePoint(q=point["q"], p=point["p"]) 
-                          for point in create_schedule_table(sellers_sorted)]
-        
-        # Calculate execution time and create metadata
-        execution_time = time.time() - start_time
-        metadata = {
-            "execution_time_ms": round(execution_time * 1000, 2),
-            "total_buyers": len(buyers_sorted),
-            "total_sellers": len(sellers_sorted),
-            "trades_possible": eq_quantity > 0,
-            "efficiency_ratio": round(eq_quantity / min(len(buyers_sorted), len(sellers_sorted)), 3) if min(len(buyers_sorted), len(sellers_sorted)) > 0 else 0
-        }
-        
+    # Log incoming request details (the totals are only needed for the log)
+    if logger.isEnabledFor(logging.INFO):
+        total_buyers = (
+            sum(seg.n for seg in params.buyer_segments) if params.buyer_segments 
+            else params.num_buyers
+        )
+        total_sellers = (
+            sum(seg.n for seg in params.seller_segments) if params.seller_segments 
+            else params.num_sellers
+        )
         logger.info(
-            f"Market simulation completed - Q*: {eq_quantity}, P*: {eq_price:.2f}, "
-            f"Surplus: {total_surplus:.2f}, Time: {execution_time*1000:.1f}ms"
+            "Market simulation requested - Buyers: %d, Sellers: %d, Seed: %s, Using segments: %s",
+            total_buyers, total_sellers, params.seed,
+            bool(params.buyer_segments or params.seller_segments)
         )
+    
+    try:
+        # Seeded simulations are deterministic, so identical requests are
+        # served from the cache; unseeded ones must be drawn fresh each time.
+        # The CPU work runs in the threadpool so the event loop stays free.
+        if params.seed is None:
+            body = await run_in_threadpool(_simulate, params)
+        else:
+            body = await run_in_threadpool(_simulate_cached, params.model_dump_json())
         
-        return MarketResponse(
-            demand=demand_schedule,
-            supply=supply_schedule,
-            equilibrium=equilibrium,
-            surplus=surplus,
-            metadata=metadata
-        )
+        # Return the encoded body directly: it is built from trusted values in
+        # the shape of MarketResponse, so FastAPI's re-validation and
+        # jsonable_encoder pass are skipped. response_model still documents it.
+        return Response(content=body, media_type="application/json")
         
     except ValueError as e:
-        logger.warning(f"Invalid market parameters: {str(e)}")
+        logger.warning("Invalid market parameters: %s", e)
         raise HTTPException(status_code=400, detail=f"Invalid parameters: {str(e)}")
     except Exception as e:
-        execution_time = time.time() - start_time
         logger.error(
-            f"Market simulation failed after {execution_time*1000:.1f}ms: {str(e)}", 
+            "Market simulation failed after %.1fms: %s",
+            (time.perf_counter() - start_time) * 1000, e,
             exc_info=True
         )
         raise HTTPException(
@@ -186,8 +192,59 @@ async def simulate_market(request: Request, params: MarketParams):
         )
 
 
+def _simulate(params: MarketParams) -> bytes:
+    """Run one market simulation and return the JSON-encoded MarketResponse."""
+    start_time = time.perf_counter()
+    
+    # Build buyers and sellers using the new segmented logic
+    buyers_sorted, sellers_sorted = build_buyers_and_sellers(params)
+    n_buyers, n_sellers = len(buyers_sorted), len(sellers_sorted)
+    logger.debug("Generated %d buyers, %d sellers", n_buyers, n_sellers)
+    
+    # Find equilibrium and maximum total surplus in one pass
+    eq_quantity, eq_price, total_surplus = solve_market(buyers_sorted, sellers_sorted)
+    
+    # Calculate execution time and create metadata
+    execution_time_ms = (time.perf_counter() - start_time) * 1000
+    min_side = n_buyers if n_buyers < n_sellers else n_sellers
+    metadata = {
+        "execution_time_ms": round(execution_time_ms, 2),
+        "total_buyers": n_buyers,
+        "total_sellers": n_sellers,
+        "trades_possible": eq_quantity > 0,
+        "efficiency_ratio": round(eq_quantity / min_side, 3) if min_side > 0 else 0
+    }
+    
+    logger.info(
+        "Market simulation completed - Q*: %d, P*: %.2f, Surplus: %.2f, Time: %.1fms",
+        eq_quantity, eq_price, total_surplus, execution_time_ms
+    )
+    
+    # Schedules go out as NumPy columns that orjson encodes straight from
+    # the array buffers
+    demand_q, demand_p = create_schedule_arrays(buyers_sorted)
+    supply_q, supply_p = create_schedule_arrays(sellers_sorted)
+    return orjson.dumps({
+        "demand": {"q": demand_q, "p": demand_p},
+        "supply": {"q": supply_q, "p": supply_p},
+        "equilibrium": {"quantity": eq_quantity, "price": eq_price},
+        "surplus": {"total_max": total_surplus},
+        "metadata": metadata
+    }, option=orjson.OPT_SERIALIZE_NUMPY)
+
+
+@lru_cache(maxsize=settings.response_cache_size)
+def _simulate_cached(params_json: str) -> bytes:
+    """Memoized _simulate for seeded requests, keyed by the canonical params JSON.
+    
+    A cache hit returns the original encoded body, including the
+    execution_time_ms measured when it was first computed.
+    """
+    return _simulate(MarketParams.model_validate_json(params_json))
+
+
 if __name__ == "__main__":
     import uvicorn
-    logger.info(f"Starting server on port {settings.default_port}")
+    logger.info("Starting server on port %d", settings.default_port)
     uvicorn.run(app, host="0.0.0.0", port=settings.default_port)
     
\ No newline at end of file
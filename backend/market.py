@@ -1,147 +1,237 @@
 """
 Market logic module for supply and demand calculations.
 
-Pure functions for:
+Functions for:
 - Building buyers/sellers from segments or simple params (integers only)
 - Sorting into demand (desc) and supply (asc)
 - Finding equilibrium (Q*, P*) by matching
 - Computing maximum total surplus up to Q*
+- Simulating batches of replicate markets
 
-All functions are pure (no side effects) for easy testing and reliability.
+The calculations are pure functions, with two exceptions. Seeded
+build_buyers_and_sellers() calls are memoized in a module-level cache and
+return shared read-only arrays. simulate_many() starts a process pool.
 """
 
-import random
 import logging
-from typing import List, Tuple, Dict, Any
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import List, Optional, Tuple, Union, Dict, Any
+
+import numpy as np
 
 from .models import MarketParams, Segment
+from .config import settings
 
 logger = logging.getLogger(__name__)
 
+# Narrowest integer dtype that holds every allowed price. Halving the element
+# size halves the bytes moved by every sort and scan; anything that adds or
+# accumulates prices widens first so it cannot overflow.
+_PRICE_DTYPE = next(
+    dtype for dtype in (np.int16, np.int32, np.int64)
+    if settings.max_price <= np.iinfo(dtype).max
+)
+
 
-# ---- validation helpers -------------------------------------------------------
+# ---- errors -------------------------------------------------------------------
 
-def _validate_segment(seg: Segment) -> None:
-    """Validate a market segment with detailed error messages."""
-    if seg.n < 0:
-        raise ValueError(f"Segment size must be >= 0, got {seg.n}")
-    if seg.p_min > seg.p_max:
-        raise ValueError(f"Invalid price range in segment: p_min ({seg.p_min}) > p_max ({seg.p_max})")
-    if seg.dist not in ("uniform", "normal"):
-        raise ValueError(f"Segment distribution must be 'uniform' or 'normal', got '{seg.dist}'")
-    if seg.dist == "normal":
-        if seg.mean is not None and not (seg.p_min <= seg.mean <= seg.p_max):
-            raise ValueError(f"Normal distribution mean ({seg.mean}) must be between p_min ({seg.p_min}) and p_max ({seg.p_max})")
-        if seg.sd is not None and seg.sd <= 0:
-            raise ValueError(f"Normal distribution standard deviation must be > 0, got {seg.sd}")
+class BuyersAbsentError(ValueError):
+    """The parameters produce a market with no buyers."""
 
 
-def _clamp_int(x: float, lo: int, hi: int) -> int:
-    """Round symmetrically, then clamp to inclusive bounds."""
-    xi = int(round(x))
-    return max(lo, min(xi, hi))
+class SellersAbsentError(ValueError):
+    """The parameters produce a market with no sellers."""
 
 
 # ---- sampling functions -------------------------------------------------------
 
-def sample_from_segments(segments: List[Segment], rng: random.Random) -> List[int]:
+def _make_rng(seed: Union[int, np.random.SeedSequence, None]) -> np.random.Generator:
+    """Generator used for all market draws, from an int seed, SeedSequence or None.
+    
+    SFC64 is NumPy's fastest bit generator and its statistical quality is
+    ample for simulations. Child streams from Generator.spawn() use the
+    same bit generator.
+    """
+    return np.random.Generator(np.random.SFC64(seed))
+
+
+def sample_from_segments(segments: List[Segment], rng: np.random.Generator) -> np.ndarray:
     """
     Sample integer values from market segments using the provided RNG.
     
     Uses 'uniform' or 'normal' distribution per segment; normal draws are 
-    clamped to segment bounds and rounded to integers.
+    clamped to segment bounds and rounded to integers. Each segment is drawn
+    in a single vectorized call from its own child stream spawned from rng,
+    so resizing one segment does not change the draws of the others.
     
     Args:
         segments: List of market segments to sample from
-        rng: Random number generator for deterministic results
+        rng: NumPy random generator for deterministic results
         
     Returns:
-        List of integer values sampled from all segments
-        
-    Raises:
-        ValueError: If any segment has invalid parameters
+        Integer array of values sampled from all segments
     """
-    if not segments:
-        return []
+    return _sample_segments(segments, rng, 1)[0]
+
+
+def _sample_segments(segments: List[Segment], rng: np.random.Generator, n_replicates: int) -> np.ndarray:
+    """Sample n_replicates independent rows from the segments; shape (R, total n)."""
+    arrs = [arr for _, arr in _segment_draws(segments, rng, n_replicates)]
+    if not arrs:
+        return np.empty((n_replicates, 0), dtype=_PRICE_DTYPE)
+    return np.concatenate(arrs, axis=1)
+
+
+def _sample_segments_sorted(segments: List[Segment], rng: np.random.Generator, n_replicates: int) -> np.ndarray:
+    """Like _sample_segments, but with every row sorted low to high.
     
-    vals: List[int] = []
+    When the segments' price ranges do not overlap, sorting each segment's
+    block and laying the blocks out by price range is already a full sort,
+    so the combined O(N log N) sort is replaced by smaller per-segment ones.
+    """
+    draws = sorted(_segment_draws(segments, rng, n_replicates), key=lambda draw: draw[0].p_min)
+    if not draws:
+        return np.empty((n_replicates, 0), dtype=_PRICE_DTYPE)
+
+    disjoint = all(lo.p_max <= hi.p_min for (lo, _), (hi, _) in zip(draws, draws[1:]))
+    if disjoint:
+        for _, arr in draws:
+            arr.sort(axis=1)
+        return np.concatenate([arr for _, arr in draws], axis=1)
+
+    values = np.concatenate([arr for _, arr in draws], axis=1)
+    values.sort(axis=1)
+    return values
+
+
+def _segment_draws(
+    segments: List[Segment],
+    rng: np.random.Generator,
+    n_replicates: int
+) -> List[Tuple[Segment, np.ndarray]]:
+    """Draw an (R, n) block per non-empty segment, in segment order."""
+    draws: List[Tuple[Segment, np.ndarray]] = []
     
-    for i, seg in enumerate(segments):
-        try:
-            _validate_segment(seg)
-        except ValueError as e:
-            raise ValueError(f"Invalid segment {i}: {e}")
-        
+    # Segment validates its own bounds, distribution and mean on construction
+    for seg, seg_rng in zip(segments, rng.spawn(len(segments))):
         if seg.n == 0:
             continue  # Skip empty segments
             
+        shape = (n_replicates, seg.n)
         span = seg.p_max - seg.p_min
 
         if seg.dist == "uniform":
-            # Uniform distribution within bounds
-            for _ in range(seg.n):
-                vals.append(rng.randint(seg.p_min, seg.p_max))  # inclusive
+            # Uniform distribution within bounds (inclusive)
+            draws.append((seg, seg_rng.integers(seg.p_min, seg.p_max + 1, size=shape, dtype=_PRICE_DTYPE)))
         else:  # "normal"
             # Normal distribution with clamping
             mean = seg.mean if seg.mean is not None else (seg.p_min + seg.p_max) / 2
             # Default sigma: span/6 gives ~95% within bounds, minimum 1.0
             sigma = float(seg.sd) if seg.sd is not None else max(1.0, span / 6.0)
             
-            for _ in range(seg.n):
-                x = rng.gauss(mean, sigma)
-                vals.append(_clamp_int(x, seg.p_min, seg.p_max))
+            # Round half to even (like round()), then clamp to inclusive bounds,
+            # both in place on the draw buffer
+            x = seg_rng.normal(mean, sigma, size=shape)
+            np.rint(x, out=x)
+            np.clip(x, seg.p_min, seg.p_max, out=x)
+            draws.append((seg, x.astype(_PRICE_DTYPE)))
     
-    logger.debug(f"Sampled {len(vals)} values from {len(segments)} segments")
-    return vals
-
+    return draws
 
-# ---- market construction -------------------------------------------------------
 
-def build_buyers_and_sellers(params: MarketParams) -> Tuple[List[int], List[int]]:
+def build_buyers_and_sellers(params: MarketParams) -> Tuple[np.ndarray, np.ndarray]:
     """
     Build buyers and sellers from either segments (preferred) or simple params (legacy).
     
+    Seeded markets are deterministic and memoized; repeated calls with the
+    same parameters return the same read-only arrays. Unseeded markets are
+    drawn fresh on every call and come back writable. Callers must not
+    modify the result in place (copy it first): code that mutates an
+    unseeded market raises "assignment destination is read-only" once a
+    seed is set.
+    
     Args:
         params: Market parameters containing either segments or simple parameters
         
     Returns:
-        Tuple of (buyers_sorted_desc, sellers_sorted_asc)
+        Tuple of (buyers_sorted_desc, sellers_sorted_asc) as integer arrays
         
     Raises:
-        ValueError: If parameters are invalid or result in empty markets
+        BuyersAbsentError: If the parameters produce no buyers
+        SellersAbsentError: If the parameters produce no sellers
+    """
+    if params.seed is None:
+        return _build_buyers_and_sellers(params)
+    return _build_buyers_and_sellers_cached(params.model_dump_json())
+
+
+@lru_cache(maxsize=settings.response_cache_size)
+def _build_buyers_and_sellers_cached(params_json: str) -> Tuple[np.ndarray, np.ndarray]:
+    """Memoized builder for seeded markets, keyed by the canonical params JSON."""
+    buyers, sellers = _build_buyers_and_sellers(MarketParams.model_validate_json(params_json))
+    # Cached arrays are shared between callers, so they must not be mutated
+    buyers.setflags(write=False)
+    sellers.setflags(write=False)
+    return buyers, sellers
+
+
+def _build_buyers_and_sellers(params: MarketParams) -> Tuple[np.ndarray, np.ndarray]:
+    """Draw and sort one market; see build_buyers_and_sellers."""
+    buyers, sellers = _build_markets(params, 1)
+    buyers_sorted, sellers_sorted = buyers[0], sellers[0]
+    
+    if logger.isEnabledFor(logging.DEBUG):
+        # Arrays are sorted, so the ranges are just the end points
+        logger.debug(
+            "Built market: %d buyers (WTP: %d-%d), %d sellers (Cost: %d-%d)",
+            len(buyers_sorted), buyers_sorted[-1], buyers_sorted[0],
+            len(sellers_sorted), sellers_sorted[0], sellers_sorted[-1]
+        )
+    
+    return buyers_sorted, sellers_sorted
+
+
+def _build_markets(params: MarketParams, n_replicates: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Draw n_replicates markets as (R, N) demand and (R, M) supply matrices.
+    
+    Each row is sorted like build_buyers_and_sellers' output: demand high to
+    low, supply low to high.
     """
-    rng = random.Random(params.seed)
+    # Independent child streams for buyers and sellers, so changing one side
+    # of the market does not change the other side's draws for the same seed
+    buyer_ss, seller_ss = np.random.SeedSequence(params.seed).spawn(2)
+    buyer_rng = _make_rng(buyer_ss)
+    seller_rng = _make_rng(seller_ss)
 
-    # Build buyers
+    # Build buyers; every row comes out sorted low to high
     if params.buyer_segments:
-        buyers = sample_from_segments(params.buyer_segments, rng)
-        if not buyers:
-            raise ValueError("Buyer segments resulted in zero buyers")
+        buyers = _sample_segments_sorted(params.buyer_segments, buyer_rng, n_replicates)
+        if buyers.size == 0:
+            raise BuyersAbsentError("Buyer segments resulted in zero buyers")
     else:
         if params.num_buyers <= 0:
-            raise ValueError(f"Number of buyers must be > 0, got {params.num_buyers}")
-        buyers = [rng.randint(params.min_wtp, params.max_wtp) for _ in range(params.num_buyers)]
+            raise BuyersAbsentError(f"Number of buyers must be > 0, got {params.num_buyers}")
+        buyers = buyer_rng.integers(
+            params.min_wtp, params.max_wtp + 1, size=(n_replicates, params.num_buyers), dtype=_PRICE_DTYPE
+        )
+        buyers.sort(axis=1)
 
-    # Build sellers
+    # Build sellers; every row comes out sorted low to high
     if params.seller_segments:
-        sellers = sample_from_segments(params.seller_segments, rng)
-        if not sellers:
-            raise ValueError("Seller segments resulted in zero sellers")
+        sellers = _sample_segments_sorted(params.seller_segments, seller_rng, n_replicates)
+        if sellers.size == 0:
+            raise SellersAbsentError("Seller segments resulted in zero sellers")
     else:
         if params.num_sellers <= 0:
-            raise ValueError(f"Number of sellers must be > 0, got {params.num_sellers}")
-        sellers = [rng.randint(params.min_cost, params.max_cost) for _ in range(params.num_sellers)]
+            raise SellersAbsentError(f"Number of sellers must be > 0, got {params.num_sellers}")
+        sellers = seller_rng.integers(
+            params.min_cost, params.max_cost + 1, size=(n_replicates, params.num_sellers), dtype=_PRICE_DTYPE
+        )
+        sellers.sort(axis=1)
 
-    # Sort for demand (high to low) and supply (low to high)
-    buyers_sorted = sorted(buyers, reverse=True)
-    sellers_sorted = sorted(sellers)
-    
-    logger.debug(
-        f"Built market: {len(buyers_sorted)} buyers (WTP: {min(buyers_sorted)}-{max(buyers_sorted)}), "
-        f"{len(sellers_sorted)} sellers (Cost: {min(sellers_sorted)}-{max(sellers_sorted)})"
-    )
-    
-    return buyers_sorted, sellers_sorted
+    # Demand runs high to low: a reversed view of the ascending rows
+    return buyers[:, ::-1], sellers
 
 
 # ---- legacy builders (kept for compatibility) ---------------------------------
@@ -149,46 +239,50 @@ def build_buyers_and_sellers(params: MarketParams) -> Tuple[List[int], List[int]
 def build_buyers(num_buyers: int, min_wtp: int, max_wtp: int, seed: int = None) -> List[int]:
     """LEGACY: Build buyers with simple parameters. Prefer build_buyers_and_sellers()."""
     if num_buyers <= 0:
-        raise ValueError(f"Number of buyers must be > 0, got {num_buyers}")
+        raise BuyersAbsentError(f"Number of buyers must be > 0, got {num_buyers}")
     if max_wtp <= min_wtp:
         raise ValueError(f"max_wtp ({max_wtp}) must be > min_wtp ({min_wtp})")
+    if seed is not None and seed < 0:
+        raise ValueError(f"seed must be >= 0, got {seed}")
     
-    rng = random.Random(seed)
-    return [rng.randint(min_wtp, max_wtp) for _ in range(num_buyers)]
+    rng = _make_rng(seed)
+    return rng.integers(min_wtp, max_wtp + 1, size=num_buyers).tolist()
 
 
 def build_sellers(num_sellers: int, min_cost: int, max_cost: int, seed: int = None) -> List[int]:
     """LEGACY: Build sellers with simple parameters. Prefer build_buyers_and_sellers()."""
     if num_sellers <= 0:
-        raise ValueError(f"Number of sellers must be > 0, got {num_sellers}")
+        raise SellersAbsentError(f"Number of sellers must be > 0, got {num_sellers}")
     if max_cost <= min_cost:
         raise ValueError(f"max_cost ({max_cost}) must be > min_cost ({min_cost})")
+    if seed is not None and seed < 0:
+        raise ValueError(f"seed must be >= 0, got {seed}")
     
-    rng = random.Random(seed)
-    return [rng.randint(min_cost, max_cost) for _ in range(num_sellers)]
+    rng = _make_rng(seed)
+    return rng.integers(min_cost, max_cost + 1, size=num_sellers).tolist()
 
 
 # ---- sorting helpers ----------------------------------------------------------
 
-def sort_demand(buyers_wtp: List[int]) -> List[int]:
+def sort_demand(buyers_wtp: List[int]) -> np.ndarray:
     """Sort willingness-to-pay values from high to low (demand curve)."""
-    return sorted(buyers_wtp, reverse=True)
+    return np.sort(np.asarray(buyers_wtp))[::-1]
 
 
-def sort_supply(sellers_cost: List[int]) -> List[int]:
+def sort_supply(sellers_cost: List[int]) -> np.ndarray:
     """Sort cost values from low to high (supply curve)."""
-    return sorted(sellers_cost)
+    return np.sort(np.asarray(sellers_cost))
 
 
 # ---- equilibrium & surplus calculations ---------------------------------------
 
-def find_equilibrium(demand: List[int], supply: List[int]) -> Tuple[int, float]:
+def find_equilibrium(demand: np.ndarray, supply: np.ndarray) -> Tuple[int, float]:
     """
     Find market equilibrium quantity and price through buyer-seller matching.
     
     Args:
-        demand: Buyer WTP values sorted high to low
-        supply: Seller cost values sorted low to high
+        demand: Buyer WTP values sorted high to low (array or list)
+        supply: Seller cost values sorted low to high (array or list)
         
     Returns:
         Tuple of (equilibrium_quantity, equilibrium_price)
@@ -199,67 +293,85 @@ def find_equilibrium(demand: List[int], supply: List[int]) -> Tuple[int, float]:
         3. Equilibrium price = midpoint of marginal matched pair
         4. If no matches, price = midpoint of best buyer and best seller
     """
-    if not demand and not supply:
+    demand = np.asarray(demand)
+    supply = np.asarray(supply)
+    n_demand, n_supply = len(demand), len(supply)
+
+    if n_demand == 0 and n_supply == 0:
         logger.warning("Empty demand and supply curves")
         return 0, 0.0
     
-    if not demand:
+    if n_demand == 0:
         logger.warning("Empty demand curve")
-        return 0, float(supply[0]) if supply else 0.0
+        return 0, float(supply[0])
     
-    if not supply:
+    if n_supply == 0:
         logger.warning("Empty supply curve")
         return 0, float(demand[0])
     
     # Early feasibility check - if highest WTP < lowest cost, no trades possible
     if demand[0] < supply[0]:
-        logger.debug(f"No trades possible: highest WTP ({demand[0]}) < lowest cost ({supply[0]})")
-        return 0, (demand[0] + supply[0]) / 2.0
-
-    # Find matches where WTP >= Cost
-    matches = 0
-    last_wtp: int = None
-    last_cost: int = None
-
-    for wtp, cost in zip(demand, supply):
-        if wtp >= cost:
-            matches += 1
-            last_wtp = wtp
-            last_cost = cost
-        else:
-            break
+        logger.debug("No trades possible: highest WTP (%s) < lowest cost (%s)", demand[0], supply[0])
+        return 0, (float(demand[0]) + float(supply[0])) / 2.0
+
+    # Find matches where WTP >= Cost. Demand descends and supply ascends, so
+    # the matched pairs form a prefix ending at the first pair with WTP < Cost.
+    n_comparable = n_demand if n_demand < n_supply else n_supply
+    traded = demand[:n_comparable] >= supply[:n_comparable]
+    matches = _match_count(traded)
+
+    return matches, _equilibrium_price(demand, supply, matches, n_comparable)
+
 
+def _margin_dtype(demand: np.ndarray, supply: np.ndarray) -> np.dtype:
+    """Dtype for WTP - cost margins: int64 for integer prices, float otherwise."""
+    return np.result_type(demand.dtype, supply.dtype, np.int64)
+
+
+def _match_count(traded: np.ndarray) -> int:
+    """Length of the all-True prefix of a non-empty boolean array.
+    
+    One argmin pass: it stops at the first False, and if the element it
+    lands on is True there is no False at all.
+    """
+    first_miss = int(traded.argmin())
+    return len(traded) if traded[first_miss] else first_miss
+
+
+def _equilibrium_price(demand: np.ndarray, supply: np.ndarray, matches: int, n_comparable: int) -> float:
+    """Equilibrium price for a non-empty market with the given match count."""
     if matches == 0:
         # No successful matches - return midpoint of best offers
-        price = (demand[0] + supply[0]) / 2.0
-        logger.debug(f"No equilibrium matches found, price set to midpoint: {price}")
-        return 0, price
+        price = (float(demand[0]) + float(supply[0])) / 2.0
+        logger.debug("No equilibrium matches found, price set to midpoint: %s", price)
+        return price
+
+    last_wtp = demand[matches - 1]
+    last_cost = supply[matches - 1]
 
     # Determine equilibrium price based on market structure
-    n_comparable = min(len(demand), len(supply))
-    
     if matches == n_comparable:
         # Full trade case - all comparable pairs matched
-        price = (last_wtp + last_cost) / 2.0
-        logger.debug(f"Full trade equilibrium: Q={matches}, P={price}")
-        return matches, price
+        price = (float(last_wtp) + float(last_cost)) / 2.0
+        logger.debug("Full trade equilibrium: Q=%d, P=%s", matches, price)
+        return price
 
     # Partial trade case - price set by marginal units
-    # Next unmatched buyer vs last matched seller
-    next_unmatched_buyer = demand[matches] if matches < len(demand) else last_wtp
-    price = (next_unmatched_buyer + last_cost) / 2.0
+    # Next unmatched buyer vs last matched seller (matches < n_comparable, so
+    # demand[matches] always exists)
+    price = (float(demand[matches]) + float(last_cost)) / 2.0
     
-    logger.debug(f"Partial trade equilibrium: Q={matches}, P={price}")
-    return matches, price
+    logger.debug("Partial trade equilibrium: Q=%d, P=%s", matches, price)
+    return price
 
 
-def compute_total_surplus_max(demand: List[int], supply: List[int], q_star: int) -> float:
+def compute_total_surplus_max(demand: np.ndarray, supply: np.ndarray, q_star: int) -> float:
     """
     Calculate maximum total surplus (consumer + producer surplus).
     
     Args:
-        demand: Buyer WTP values sorted high to low
-        supply: Seller cost values sorted low to high  
+        demand: Buyer WTP values sorted high to low (array or list)
+        supply: Seller cost values sorted low to high (array or list)
         q_star: Equilibrium quantity
         
     Returns:
@@ -274,16 +386,171 @@ def compute_total_surplus_max(demand: List[int], supply: List[int], q_star: int)
     if n_tradeable == 0:
         return 0.0
     
-    # Sum (demand[i] - supply[i]) for each traded unit
-    total_surplus = sum(demand[i] - supply[i] for i in range(n_tradeable))
+    # Sum (demand[i] - supply[i]) for each traded unit; integer prices widen
+    # to int64 so the reduction cannot overflow, float prices stay exact
+    d = np.asarray(demand[:n_tradeable])
+    s = np.asarray(supply[:n_tradeable])
+    total_surplus = float((d.astype(_margin_dtype(d, s)) - s).sum())
+    
+    logger.debug("Total surplus calculated: %s over %d units", total_surplus, n_tradeable)
+    return total_surplus
+
+
+def solve_market(demand: np.ndarray, supply: np.ndarray) -> Tuple[int, float, float]:
+    """
+    Find equilibrium and maximum total surplus in a single pass.
+    
+    Equivalent to find_equilibrium() followed by compute_total_surplus_max()
+    at Q*, but the WTP - cost margins are computed once and shared by the
+    match count and the surplus sum.
     
-    logger.debug(f"Total surplus calculated: {total_surplus} over {n_tradeable} units")
-    return float(total_surplus)
+    Args:
+        demand: Buyer WTP values sorted high to low (array or list)
+        supply: Seller cost values sorted low to high (array or list)
+        
+    Returns:
+        Tuple of (equilibrium_quantity, equilibrium_price, total_surplus)
+    """
+    demand = np.asarray(demand)
+    supply = np.asarray(supply)
+
+    if len(demand) == 0 or len(supply) == 0:
+        eq_quantity, eq_price = find_equilibrium(demand, supply)
+        return eq_quantity, eq_price, 0.0
+
+    n_comparable = min(len(demand), len(supply))
+    margins = demand[:n_comparable].astype(_margin_dtype(demand, supply)) - supply[:n_comparable]
+    matches = _match_count(margins >= 0)
+
+    price = _equilibrium_price(demand, supply, matches, n_comparable)
+    total_surplus = float(margins[:matches].sum())
+    return matches, price, total_surplus
+
+
+# ---- batch simulation ---------------------------------------------------------
+
+def simulate_batch(params: MarketParams, n_replicates: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Simulate many independent markets drawn from the same parameters.
+    
+    All replicates are sampled, sorted and solved together as (R, N) matrices,
+    so the cost per replicate is a few vectorized operations rather than a
+    full build_buyers_and_sellers() + solve_market() round trip. Results are
+    reproducible for a given seed, and replicate 0 is the same market that
+    build_buyers_and_sellers() returns for that seed.
+    
+    Args:
+        params: Market parameters shared by every replicate
+        n_replicates: Number of markets to simulate (R)
+        
+    Returns:
+        Tuple of (quantities, prices, surpluses), each an array of shape (R,)
+        
+    Raises:
+        ValueError: If n_replicates < 1
+        BuyersAbsentError, SellersAbsentError: If a side of the market is empty
+    """
+    if n_replicates < 1:
+        raise ValueError(f"Number of replicates must be >= 1, got {n_replicates}")
+
+    demand, supply = _build_markets(params, n_replicates)
+    matches, prices, margins = _solve_markets(demand, supply)
+
+    in_trade = np.arange(margins.shape[1]) < matches[:, None]
+    surpluses = np.where(in_trade, margins, 0).sum(axis=1).astype(np.float64)
+
+    return matches, prices, surpluses
+
+
+def find_equilibria_batch(demands: np.ndarray, supplies: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Find the equilibrium of many markets at once.
+    
+    Row r of the result equals find_equilibrium(demands[r], supplies[r]).
+    
+    Args:
+        demands: (R, N) buyer WTP values, each row sorted high to low
+        supplies: (R, M) seller cost values, each row sorted low to high
+        
+    Returns:
+        Tuple of (equilibrium_quantities, equilibrium_prices), each of shape (R,)
+        
+    Raises:
+        ValueError: If the inputs are not 2-D with matching row counts and
+            at least one buyer and one seller per market
+    """
+    demands = np.asarray(demands)
+    supplies = np.asarray(supplies)
+    if demands.ndim != 2 or supplies.ndim != 2 or len(demands) != len(supplies):
+        raise ValueError(
+            f"Expected (R, N) demands and (R, M) supplies, got {demands.shape} and {supplies.shape}"
+        )
+    if demands.shape[1] == 0 or supplies.shape[1] == 0:
+        raise ValueError("Every market needs at least one buyer and one seller")
+
+    matches, prices, _ = _solve_markets(demands, supplies)
+    return matches, prices
+
+
+def _solve_markets(demand: np.ndarray, supply: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Row-wise solve_market on non-empty (R, N) and (R, M) sorted schedules.
+    
+    Returns (matches, prices, margins), where margins holds the int64
+    WTP - cost of every comparable pair.
+    """
+    # Same prefix matching as solve_market, row by row
+    n_comparable = min(demand.shape[1], supply.shape[1])
+    # Widen integer prices to int64; float prices stay float
+    margins = demand[:, :n_comparable].astype(_margin_dtype(demand, supply)) - supply[:, :n_comparable]
+    traded = margins >= 0
+    rows = np.arange(len(margins))
+    first_miss = traded.argmin(axis=1)
+    matches = np.where(traded[rows, first_miss], n_comparable, first_miss)
+
+    # Price pair per row, mirroring _equilibrium_price: best offers when nothing
+    # trades, the last matched pair on full trade, otherwise the next buyer
+    # against the last matched seller
+    demand_idx = np.where(matches == n_comparable, n_comparable - 1, matches)
+    supply_idx = np.maximum(matches - 1, 0)
+    prices = (demand[rows, demand_idx].astype(np.float64) + supply[rows, supply_idx]) / 2.0
+
+    return matches, prices, margins
+
+
+def simulate_many(
+    params_list: List[MarketParams],
+    max_workers: Optional[int] = None
+) -> List[Tuple[int, float, float]]:
+    """
+    Simulate independent markets with different parameters across processes.
+    
+    Each market is built and solved in a worker process, so sweeps over many
+    seeds or settings use every core instead of running serially under the
+    GIL. For many replicates of the same parameters, simulate_batch() is
+    cheaper.
+    
+    Args:
+        params_list: Parameters for each market to simulate
+        max_workers: Worker process count (defaults to the number of CPUs)
+        
+    Returns:
+        List of (equilibrium_quantity, equilibrium_price, total_surplus),
+        in the same order as params_list
+    """
+    if not params_list:
+        return []
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(_simulate_one, params_list))
+
+
+def _simulate_one(params: MarketParams) -> Tuple[int, float, float]:
+    """Build and solve one market; the unit of work for simulate_many()."""
+    return solve_market(*build_buyers_and_sellers(params))
 
 
 # ---- schedule table generation ------------------------------------------------
 
-def create_schedule_table(values: List[int]) -> List[Dict[str, int]]:
+def create_schedule_table(values: List[int]) -> Dict[str, List[int]]:
     """
     Create step schedule table from sorted values.
     
@@ -291,43 +558,70 @@ def create_schedule_table(values: List[int]) -> List[Dict[str, int]]:
         values: Sorted price values (demand: high->low, supply: low->high)
         
     Returns:
-        List of {"q": quantity, "p": price} dictionaries
+        {"q": quantities, "p": prices} as two parallel lists, matching
+        the Schedule model
     """
-    if not values:
-        return []
+    prices = values.tolist() if isinstance(values, np.ndarray) else list(values)
+    return {"q": list(range(1, len(prices) + 1)), "p": prices}
+
+
+def create_schedule_arrays(values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Create step schedule columns from sorted values without building lists.
     
-    return [{"q": i + 1, "p": v} for i, v in enumerate(values)]
+    Both arrays are C-contiguous, as orjson's OPT_SERIALIZE_NUMPY requires;
+    the reversed demand view is copied once here.
+    
+    Args:
+        values: Sorted price array (demand: high->low, supply: low->high)
+        
+    Returns:
+        Tuple of (quantities 1..n, prices)
+    """
+    prices = np.ascontiguousarray(values)
+    return np.arange(1, prices.size + 1, dtype=np.int32), prices
 
 
 # ---- market analysis utilities ------------------------------------------------
 
-def analyze_market_structure(demand: List[int], supply: List[int]) -> Dict[str, Any]:
+def analyze_market_structure(
+    demand: np.ndarray,
+    supply: np.ndarray,
+    equilibrium: Optional[Tuple[int, float]] = None
+) -> Dict[str, Any]:
     """
     Analyze market structure and return key statistics.
     
     Args:
-        demand: Buyer WTP values sorted high to low
-        supply: Seller cost values sorted low to high
+        demand: Buyer WTP values sorted high to low (array or list)
+        supply: Seller cost values sorted low to high (array or list)
+        equilibrium: Optional (Q*, P*) already computed by the caller;
+            find_equilibrium() is only called when it is not provided
         
     Returns:
-        Dictionary with market analysis metrics
+        Dictionary with market analysis metrics (native Python values)
     """
+    demand = np.asarray(demand)
+    supply = np.asarray(supply)
+    
+    # Both schedules are sorted, so the ranges are just their end points;
+    # values are converted back to Python scalars
     analysis = {
         "demand_size": len(demand),
         "supply_size": len(supply),
-        "demand_range": (min(demand), max(demand)) if demand else (0, 0),
-        "supply_range": (min(supply), max(supply)) if supply else (0, 0),
+        "demand_range": (demand[-1].item(), demand[0].item()) if len(demand) else (0, 0),
+        "supply_range": (supply[0].item(), supply[-1].item()) if len(supply) else (0, 0),
         "potential_trades": min(len(demand), len(supply)),
     }
     
-    if demand and supply:
+    if len(demand) and len(supply):
         # Market overlap analysis
-        analysis["demand_avg"] = sum(demand) / len(demand)
-        analysis["supply_avg"] = sum(supply) / len(supply)
-        analysis["price_overlap"] = demand[0] >= supply[0]  # Best buyer can afford cheapest seller
+        analysis["demand_avg"] = float(demand.mean())
+        analysis["supply_avg"] = float(supply.mean())
+        analysis["price_overlap"] = bool(demand[0] >= supply[0])  # Best buyer can afford cheapest seller
         
         # Efficiency potential
-        eq_q, eq_p = find_equilibrium(demand, supply)
+        eq_q, eq_p = equilibrium if equilibrium is not None else find_equilibrium(demand, supply)
         analysis["equilibrium_quantity"] = eq_q
         analysis["equilibrium_price"] = eq_p
         analysis["market_efficiency"] = eq_q / analysis["potential_trades"] if analysis["potential_trades"] > 0 else 0
@@ -335,30 +629,40 @@ def analyze_market_structure(demand: List[int], supply: List[int]) -> Dict[str,
     return analysis
 
 
-def validate_market_inputs(demand: List[int], supply: List[int]) -> None:
+def validate_market_inputs(demand: np.ndarray, supply: np.ndarray) -> None:
     """
     Validate market inputs and raise descriptive errors if invalid.
     
     Args:
-        demand: Buyer WTP values
-        supply: Seller cost values
+        demand: Buyer WTP values (1-D array or list)
+        supply: Seller cost values (1-D array or list)
         
     Raises:
         ValueError: If inputs are invalid
     """
-    if not isinstance(demand, list):
-        raise ValueError(f"Demand must be a list, got {type(demand)}")
-    if not isinstance(supply, list):
-        raise ValueError(f"Supply must be a list, got {type(supply)}")
+    demand_arr = _validate_prices("demand", demand)
+    supply_arr = _validate_prices("supply", supply)
     
-    if not demand and not supply:
+    if len(demand_arr) == 0 and len(supply_arr) == 0:
         raise ValueError("Both demand and supply are empty")
+
+
+def _validate_prices(side: str, values: np.ndarray) -> np.ndarray:
+    """Check one side is a 1-D sequence of non-negative numbers; return it as an array."""
+    arr = np.asarray(values)
+    if arr.ndim != 1:
+        raise ValueError(f"{side.capitalize()} must be a 1-D sequence, got shape {arr.shape}")
+    
+    if arr.dtype.kind not in "iuf":
+        # Point at the first element that is not a number
+        i = next(
+            (i for i, val in enumerate(values) if not isinstance(val, (int, float, np.number))), 0
+        )
+        raise ValueError(f"Invalid {side} value at index {i}: {values[i]} (must be non-negative number)")
     
-    # Check for non-numeric values
-    for i, val in enumerate(demand):
-        if not isinstance(val, (int, float)) or val < 0:
-            raise ValueError(f"Invalid demand value at index {i}: {val} (must be non-negative number)")
+    negative = np.flatnonzero(arr < 0)
+    if negative.size:
+        i = int(negative[0])
+        raise ValueError(f"Invalid {side} value at index {i}: {arr[i].item()} (must be non-negative number)")
     
-    for i, val in enumerate(supply):
-        if not isinstance(val, (int, float)) or val < 0:
-            raise ValueError(f"Invalid supply value at index {i}: {val} (must be non-negative number)")
\ No newline at end of file
+    return arr
@@ -4,14 +4,14 @@ Pydantic models for API request and response schemas.
 This module defines the data structures used for:
 - Market parameters (input validation with sensible defaults)
 - Segmented market parameters (buyers/sellers with different price ranges)
-- Price points in demand/supply schedules
+- Demand/supply schedules (column-oriented quantity and price lists)
 - Market response with equilibrium results and surplus calculation
 
 All models include validation and clear field descriptions.
 """
 
 from typing import List, Optional, Literal, Dict, Any
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 from .config import settings
 
@@ -21,6 +21,8 @@ class Segment(BaseModel):
     
     Represents a group of market participants with similar price characteristics.
     """
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     n: int = Field(
         ge=0,
         le=settings.max_buyers,  # Use config for limits
@@ -71,7 +73,10 @@ class MarketParams(BaseModel):
     
     Supports both legacy simple parameters and new segmented parameters.
     When segments are provided, they take precedence over simple parameters.
+    Validated once on construction and immutable afterwards.
     """
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     # Legacy simple params (keep for fallback)
     num_buyers: int = Field(
         default=10,
@@ -111,7 +116,8 @@ class MarketParams(BaseModel):
     )
     seed: Optional[int] = Field(
         default=None,
-        description="Random seed for reproducible results (optional)"
+        ge=0,
+        description="Random seed for reproducible results (optional, non-negative)"
     )
 
     # New segmented params (use these if provided and non-empty)
@@ -127,63 +133,63 @@ class MarketParams(BaseModel):
     )
 
     @model_validator(mode="after")
-    def validate_segments_and_feasibility(self):
-        """Validate segment parameters and market feasibility."""
-        
-        # Validate segment counts and totals
-        for name in ("buyer_segments", "seller_segments"):
-            segs = getattr(self, name, None)
-            if segs:
-                if not (1 <= len(segs) <= settings.max_segments):
-                    raise ValueError(f"{name} must have between 1 and {settings.max_segments} segments")
-                
-                # Check total participants don't exceed limits
-                total_n = sum(s.n for s in segs)
-                max_limit = settings.max_buyers if name == "buyer_segments" else settings.max_sellers
-                if total_n > max_limit:
-                    raise ValueError(f"Total participants in {name} ({total_n}) exceeds limit ({max_limit})")
+    def validate_market(self):
+        """Validate whichever side parameters are in use and market feasibility.
         
-        # Check market feasibility - warn if no overlap possible
-        self._check_market_feasibility()
-        
-        return self
-    
-    def _check_market_feasibility(self):
-        """Check if the market parameters allow for any possible trades."""
-        if self.buyer_segments and self.seller_segments:
+        Segment counts are already bounded by max_length, and each segment
+        validates itself, so only the totals are checked here.
+        """
+        buyer_segments, seller_segments = self.buyer_segments, self.seller_segments
+
+        # One pass per side collects the total and the price bound that the
+        # feasibility check needs
+        if buyer_segments:
+            total_n, max_buyer_price = 0, 0
+            for seg in buyer_segments:
+                total_n += seg.n
+                if seg.p_max > max_buyer_price:
+                    max_buyer_price = seg.p_max
+            if total_n > settings.max_buyers:
+                raise ValueError(f"Total participants in buyer_segments ({total_n}) exceeds limit ({settings.max_buyers})")
+        elif self.max_wtp <= self.min_wtp:
+            raise ValueError(f"max_wtp ({self.max_wtp}) must be greater than min_wtp ({self.min_wtp})")
+
+        if seller_segments:
+            total_n, min_seller_price = 0, settings.max_price
+            for seg in seller_segments:
+                total_n += seg.n
+                if seg.p_min < min_seller_price:
+                    min_seller_price = seg.p_min
+            if total_n > settings.max_sellers:
+                raise ValueError(f"Total participants in seller_segments ({total_n}) exceeds limit ({settings.max_sellers})")
+        elif self.max_cost <= self.min_cost:
+            raise ValueError(f"max_cost ({self.max_cost}) must be greater than min_cost ({self.min_cost})")
+
+        # Market feasibility - reject parameters that can never trade
+        if buyer_segments and seller_segments:
             # For segmented markets, check if any buyer segment can trade with any seller segment
-            max_buyer_price = max(seg.p_max for seg in self.buyer_segments)
-            min_seller_price = min(seg.p_min for seg in self.seller_segments)
             if max_buyer_price < min_seller_price:
                 raise ValueError(
                     f"No trades possible: highest buyer max ({max_buyer_price}) "
                     f"< lowest seller min ({min_seller_price})"
                 )
-        elif not self.buyer_segments and not self.seller_segments:
+        elif not buyer_segments and not seller_segments:
             # For simple parameters, check basic feasibility
             if self.max_wtp < self.min_cost:
                 raise ValueError(
                     f"No trades possible: max_wtp ({self.max_wtp}) < min_cost ({self.min_cost})"
                 )
 
-    def model_post_init(self, __context) -> None:
-        """Additional validation after model creation."""
-        # Only validate legacy params if segments aren't provided
-        if not self.buyer_segments:
-            if self.max_wtp <= self.min_wtp:
-                raise ValueError(f"max_wtp ({self.max_wtp}) must be greater than min_wtp ({self.min_wtp})")
-        if not self.seller_segments:
-            if self.max_cost <= self.min_cost:
-                raise ValueError(f"max_cost ({self.max_cost}) must be greater than min_cost ({self.min_cost})")
+        return self
 
 
-class PricePoint(BaseModel):
-    """A single point in a demand or supply schedule.
+class Schedule(BaseModel):
+    """A demand or supply schedule in column form.
     
-    Represents quantity q at price p.
+    q[i] is the quantity at price p[i]; both lists have the same length.
     """
-    q: int = Field(ge=0, description="Quantity")
-    p: int = Field(ge=0, description="Price")
+    q: List[int] = Field(description="Quantities (1..n)")
+    p: List[int] = Field(description="Price at each quantity")
 
 
 class Equilibrium(BaseModel):
@@ -207,9 +213,11 @@ class MarketResponse(BaseModel):
     """Complete market simulation results.
     
     Contains demand schedule, supply schedule, equilibrium, surplus, and execution metadata.
+    The /market endpoint emits this shape directly without constructing the model,
+    so it documents the response schema and is checked in tests/test_api.py.
     """
-    demand: List[PricePoint] = Field(description="Demand schedule (sorted high to low)")
-    supply: List[PricePoint] = Field(description="Supply schedule (sorted low to high)")
+    demand: Schedule = Field(description="Demand schedule (sorted high to low)")
+    supply: Schedule = Field(description="Supply schedule (sorted low to high)")
     equilibrium: Equilibrium = Field(description="Market equilibrium")
     surplus: Surplus = Field(description="Economic surplus calculations")
     metadata: Dict[str, Any] = Field(
@@ -8,9 +8,10 @@ export interface Segment {
   sd?: number | null;
 }
 
-export interface PricePoint {
-  q: number;
-  p: number;  // Integer price
+// Schedule in column form: q[i] is the quantity at price p[i]
+export interface Schedule {
+  q: number[];
+  p: number[];  // Integer prices
 }
 
 export interface MarketParams {
@@ -30,8 +31,8 @@ export interface MarketParams {
 }
 
 export interface MarketResponse {
-  demand: PricePoint[];
-  supply: PricePoint[];
+  demand: Schedule;
+  supply: Schedule;
   equilibrium: {
     quantity: number;
     price: number | null;
@@ -331,6 +331,7 @@ export function Controls({ params, onParamsChange, onGenerate, loading }: Contro
         <input
           id="seed"
           type="number"
+          min={0}
           placeholder="Leave empty for random"
           value={seedStr}
           onChange={(e) => handleSeedChange(e.target.value)}
@@ -11,11 +11,11 @@ import {
   Scatter,
   ResponsiveContainer
 } from 'recharts';
-import { PricePoint } from '../api';
+import { Schedule } from '../api';
 
 interface MarketChartProps {
-  demand: PricePoint[];
-  supply: PricePoint[];
+  demand: Schedule;
+  supply: Schedule;
   equilibrium: {
     quantity: number;
     price: number | null;
@@ -28,10 +28,8 @@ interface MarketChartProps {
 export function MarketChart({ demand, supply, equilibrium, surplus }: MarketChartProps) {
   // Combine demand and supply data for the chart
   const chartData = useMemo(() => {
-    const maxQ = Math.max(
-      demand.length > 0 ? demand[demand.length - 1].q : 0,
-      supply.length > 0 ? supply[supply.length - 1].q : 0
-    );
+    // Quantities run 1..n, so the price for quantity i is at index i - 1
+    const maxQ = Math.max(demand.q.length, supply.q.length);
 
     const data: Array<{
       q: number;
@@ -40,13 +38,10 @@ export function MarketChart({ demand, supply, equilibrium, surplus }: MarketChar
     }> = [];
 
     for (let i = 1; i <= maxQ; i++) {
-      const demandPoint = demand.find(d => d.q === i);
-      const supplyPoint = supply.find(s => s.q === i);
-
       data.push({
         q: i,
-        demandP: demandPoint ? demandPoint.p : null,
-        supplyP: supplyPoint ? supplyPoint.p : null,
+        demandP: i <= demand.p.length ? demand.p[i - 1] : null,
+        supplyP: i <= supply.p.length ? supply.p[i - 1] : null,
       });
     }
 
@@ -14,38 +14,41 @@ What this script does:
 No external libraries are used; everything is built-in.
 """
 
+import sys
 from typing import List, Tuple
 import random as rnd
 
-def build_buyers() -> List[float]:
+def build_buyers() -> List[int]:
     """Create a list of buyers' willingness to pay (WTP).
 
     You can change these values to experiment.
     Higher numbers mean a buyer is willing to pay more.
     """
-    return [rnd.randint(10, 40) for _ in range(9)]
+    # One bulk draw of 9 values from 10..40 inclusive
+    return rnd.choices(range(10, 41), k=9)
 
 
-def build_sellers() -> List[float]:
+def build_sellers() -> List[int]:
     """Create a list of sellers' costs.
 
     You can change these values to experiment.
     Lower numbers mean a seller can supply more cheaply.
     """
-    return [rnd.randint(5, 30) for _ in range(9)]
+    # One bulk draw of 9 values from 5..30 inclusive
+    return rnd.choices(range(5, 31), k=9)
 
 
-def sort_demand(buyers_wtp: List[float]) -> List[float]:
+def sort_demand(buyers_wtp: List[int]) -> List[int]:
     """Return buyers sorted from highest WTP to lowest (demand curve)."""
     return sorted(buyers_wtp, reverse=True)
 
 
-def sort_supply(sellers_cost: List[float]) -> List[float]:
+def sort_supply(sellers_cost: List[int]) -> List[int]:
     """Return sellers sorted from lowest cost to highest (supply curve)."""
     return sorted(sellers_cost)
 
 
-def print_schedule(title: str, prices: List[float]) -> None:
+def print_schedule(title: str, prices: List[int]) -> None:
     """Print a schedule as a simple two-column table: Quantity and Price.
 
     Quantity counts up from 1 to len(prices). Price is the corresponding value.
@@ -53,17 +56,21 @@ def print_schedule(title: str, prices: List[float]) -> None:
     print(f"{title}:")
     print("Quantity | Price")
     print("---------+------")
-    for i, p in enumerate(prices, start=1):
-        # Format quantity right-aligned to width 8, price right-aligned to width 6
-        print(f"{i:>8} | {p:>6}")
+    # Format quantity right-aligned to width 8, price right-aligned to width 6,
+    # then write all rows in one go rather than printing them one by one.
+    rows = ["%8d | %6s\n" % row for row in enumerate(prices, start=1)]
+    sys.stdout.write("".join(rows))
     print()
 
 
-def find_equilibrium(demand: List[float], supply: List[float]) -> Tuple[int, float]:
+def find_equilibrium(demand: List[int], supply: List[int]) -> Tuple[int, float]:
     """Find equilibrium quantity and price by matching buyers and sellers.
 
-    We walk down the demand (high to low) and up the supply (low to high),
-    matching pairs while buyer WTP >= seller cost.
+    `demand` must be sorted high to low and `supply` low to high (see
+    sort_demand / sort_supply). Then once a buyer's WTP falls below the paired
+    seller's cost it stays below for every later pair, so the matched pairs
+    form a prefix and we binary search for its length. On unsorted input
+    the search is not valid and the result is meaningless.
 
     - Equilibrium quantity (Q*) is the number of successful matches.
     - Equilibrium price (P*) is set here as the average of the marginal matched
@@ -73,20 +80,17 @@ def find_equilibrium(demand: List[float], supply: List[float]) -> Tuple[int, flo
     If there is no trade (Q* == 0), we set price to the midpoint between the
     highest WTP and lowest cost just for reference.
     """
-    matches = 0
-    last_matched_wtp = None
-    last_matched_cost = None
-
-    # Iterate pairwise until one list runs out
-    for wtp, cost in zip(demand, supply):
-        if wtp >= cost:
-            matches += 1
-            last_matched_wtp = wtp
-            last_matched_cost = cost
+    # Demand descends while supply ascends, so once WTP < cost for one pair
+    # it stays that way: the matched pairs are a prefix. Binary search for
+    # its length instead of walking every pair.
+    lo, hi = 0, min(len(demand), len(supply))
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if demand[mid] >= supply[mid]:
+            lo = mid + 1
         else:
-            # As soon as WTP < cost, further matches won't work because
-            # demand descends while supply ascends.
-            break
+            hi = mid
+    matches = lo
 
     if matches == 0:
         # No trade possible; set a reference price between highest WTP and lowest cost
@@ -96,7 +100,7 @@ def find_equilibrium(demand: List[float], supply: List[float]) -> Tuple[int, flo
         return 0, price
 
     # Use midpoint between marginal matched WTP and cost as a simple equilibrium price
-    price = (last_matched_wtp + last_matched_cost) / 2  # type: ignore
+    price = (demand[matches - 1] + supply[matches - 1]) / 2
     return matches, price
 
 
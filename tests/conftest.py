@@ -1,12 +1,26 @@
 # tests/conftest.py
 import pytest
 from backend.models import Segment, MarketParams
+from backend.market import _build_buyers_and_sellers_cached, _make_rng
+from backend.main import _simulate_cached
+
+@pytest.fixture(autouse=True)
+def clear_market_caches():
+    # seeded builds and responses are memoized; start every test cold
+    yield
+    _build_buyers_and_sellers_cached.cache_clear()
+    _simulate_cached.cache_clear()
 
 @pytest.fixture
 def rng_seed() -> int:
     # fixed seed gives reproducibility across the whole test run
     return 12345
 
+@pytest.fixture
+def rng(rng_seed):
+    # same bit generator (SFC64) the market code draws from
+    return _make_rng(rng_seed)
+
 @pytest.fixture
 def buyers_uniform_segments():
     # two segments, non-overlapping, uniform draws
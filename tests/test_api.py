@@ -0,0 +1,93 @@
+"""
+API tests for the FastAPI endpoints.
+
+Run with: python -m pytest tests/test_api.py -v
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from backend.main import app, _simulate_cached
+from backend.models import MarketResponse, HealthResponse
+
+
+@pytest.fixture
+def client():
+    return TestClient(app)
+
+
+class TestMarketEndpoint:
+    """Test the /market simulation endpoint."""
+
+    def test_simple_parameters_match_schema(self, client):
+        """The hand-built payload must validate against MarketResponse."""
+        response = client.post("/market", json={"num_buyers": 5, "num_sellers": 5, "seed": 42})
+
+        assert response.status_code == 200
+        result = MarketResponse.model_validate(response.json())
+        assert result.demand.q == [1, 2, 3, 4, 5]
+        assert result.supply.q == [1, 2, 3, 4, 5]
+        assert result.demand.p == sorted(result.demand.p, reverse=True)
+        assert result.supply.p == sorted(result.supply.p)
+
+    def test_segmented_parameters_match_schema(self, client):
+        """Segmented requests produce the same response shape."""
+        response = client.post("/market", json={
+            "seed": 123,
+            "buyer_segments": [
+                {"n": 6, "p_min": 30, "p_max": 40},
+                {"n": 4, "p_min": 20, "p_max": 29, "dist": "normal"}
+            ],
+            "seller_segments": [
+                {"n": 5, "p_min": 10, "p_max": 15},
+                {"n": 5, "p_min": 16, "p_max": 25}
+            ]
+        })
+
+        assert response.status_code == 200
+        result = MarketResponse.model_validate(response.json())
+        assert result.metadata["total_buyers"] == 10
+        assert result.metadata["total_sellers"] == 10
+
+    def test_seeded_requests_are_cached(self, client):
+        """Identical seeded requests are served from the response cache."""
+        _simulate_cached.cache_clear()
+        body = {"num_buyers": 7, "num_sellers": 6, "seed": 7}
+
+        first = client.post("/market", json=body)
+        second = client.post("/market", json=body)
+
+        assert first.content == second.content
+        assert _simulate_cached.cache_info().hits == 1
+
+    def test_negative_seed_rejected(self, client):
+        """Seeds must be non-negative; a negative one is a validation error."""
+        response = client.post("/market", json={"num_buyers": 5, "num_sellers": 5, "seed": -1})
+
+        assert response.status_code == 422
+
+    def test_unknown_field_rejected(self, client):
+        """Unknown request keys (e.g. typos) are a validation error, not ignored."""
+        response = client.post("/market", json={"num_buyer": 5})
+
+        assert response.status_code == 422
+
+    def test_empty_buyer_segments_rejected(self, client):
+        """Segments that produce no buyers return a 400."""
+        response = client.post("/market", json={
+            "buyer_segments": [{"n": 0, "p_min": 30, "p_max": 40}],
+            "seller_segments": [{"n": 5, "p_min": 10, "p_max": 15}]
+        })
+
+        assert response.status_code == 400
+        assert "zero buyers" in response.json()["detail"]
+
+
+class TestHealthEndpoint:
+    """Test the /health endpoint."""
+
+    def test_health_ok(self, client):
+        response = client.get("/health")
+
+        assert response.status_code == 200
+        assert HealthResponse.model_validate(response.json()).status == "ok"
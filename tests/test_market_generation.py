@@ -0,0 +1,81 @@
+"""
+Unit tests for buyer/seller value generation.
+
+Run with: python -m pytest tests/test_market_generation.py -v
+"""
+
+import numpy as np
+
+from backend.market import (
+    _make_rng,
+    sample_from_segments,
+    build_buyers_and_sellers,
+    _sample_segments,
+    _sample_segments_sorted
+)
+from backend.models import Segment
+from tests.conftest import make_params
+
+
+class TestSampleFromSegments:
+    """Test batched sampling from market segments."""
+
+    def test_uniform_segments_are_inclusive_and_deterministic(self, buyers_uniform_segments, rng, rng_seed):
+        """Test that uniform draws stay in bounds, are integers and repeat per seed."""
+        values = sample_from_segments(buyers_uniform_segments, rng)
+        again = sample_from_segments(buyers_uniform_segments, _make_rng(rng_seed))
+
+        assert np.issubdtype(values.dtype, np.integer)
+        assert values.tolist() == again.tolist()
+        # Segments are concatenated in order
+        assert values.size == 30
+        assert all(30 <= v <= 50 for v in values[:20])
+        assert all(10 <= v <= 20 for v in values[20:])
+
+    def test_normal_segment_is_clamped_and_integral(self, sellers_normal_segment, rng):
+        """Test that normal draws are rounded and clamped to the segment."""
+        values = sample_from_segments(sellers_normal_segment, rng)
+
+        assert np.issubdtype(values.dtype, np.integer)
+        assert values.size == 25
+        assert values.min() >= 15 and values.max() <= 35
+
+    def test_resizing_a_segment_keeps_the_others(self, buyers_uniform_segments, rng, rng_seed):
+        """Test that each segment draws from its own stream."""
+        resized = [buyers_uniform_segments[0], Segment(n=3, p_min=10, p_max=20)]
+
+        values = sample_from_segments(buyers_uniform_segments, rng)
+        resized_values = sample_from_segments(resized, _make_rng(rng_seed))
+
+        assert values[:20].tolist() == resized_values[:20].tolist()
+
+    def test_sorted_sampling_matches_full_sort(self, buyers_uniform_segments, sellers_normal_segment, rng_seed):
+        """Test that per-segment sorting of disjoint ranges equals a full sort."""
+        overlapping = buyers_uniform_segments + sellers_normal_segment
+        for segments in (buyers_uniform_segments, overlapping):
+            values = _sample_segments(segments, _make_rng(rng_seed), 5)
+            sorted_values = _sample_segments_sorted(segments, _make_rng(rng_seed), 5)
+
+            assert sorted_values.tolist() == np.sort(values, axis=1).tolist()
+
+    def test_no_segments(self, rng):
+        """Test that no segments produce an empty array."""
+        assert sample_from_segments([], rng).size == 0
+
+
+class TestBuildFromSegments:
+    """Test market construction from the shared segment fixtures."""
+
+    def test_segmented_market_is_sorted(self, buyers_uniform_segments, sellers_normal_segment, rng_seed):
+        """Test that segmented markets come back as sorted schedules."""
+        params = make_params(
+            seed=rng_seed,
+            buyer_segments=buyers_uniform_segments,
+            seller_segments=sellers_normal_segment,
+        )
+
+        buyers, sellers = build_buyers_and_sellers(params)
+
+        assert len(buyers) == 30 and len(sellers) == 25
+        assert buyers.tolist() == sorted(buyers.tolist(), reverse=True)
+        assert sellers.tolist() == sorted(sellers.tolist())
@@ -4,15 +4,26 @@ Unit tests for market logic functions.
 Run with: python -m pytest test_market.py -v
 """
 
+import numpy as np
 import pytest
 from backend.market import (
     find_equilibrium, 
     build_buyers_and_sellers, 
+    build_buyers,
     compute_total_surplus_max,
+    solve_market,
+    simulate_batch,
+    find_equilibria_batch,
+    simulate_many,
+    _build_markets,
     create_schedule_table,
-    analyze_market_structure
+    create_schedule_arrays,
+    analyze_market_structure,
+    validate_market_inputs,
+    BuyersAbsentError
 )
 from backend.models import MarketParams, Segment
+from backend.config import settings
 
 
 class TestEquilibrium:
@@ -57,6 +68,14 @@ class TestEquilibrium:
         assert find_equilibrium([10], []) == (0, 10.0)
         assert find_equilibrium([], [5]) == (0, 5.0)
 
+    def test_narrow_dtype_prices_do_not_overflow(self):
+        """Test that midpoints of large int16 prices are computed exactly."""
+        demand = np.array([30000, 29000], dtype=np.int16)
+        supply = np.array([20000, 31000], dtype=np.int16)
+
+        assert find_equilibrium(demand, supply) == (1, 24500.0)
+        assert solve_market(demand, supply) == (1, 24500.0, 10000.0)
+
 
 class TestSurplusCalculation:
     """Test total surplus calculations."""
@@ -92,6 +111,119 @@ class TestSurplusCalculation:
         # Should only calculate for 2 trades: (10-3) + (8-5) = 10
         assert surplus == 10.0
 
+    def test_fractional_prices(self):
+        """Test that non-integer prices are summed exactly, not truncated."""
+        assert compute_total_surplus_max([10.5], [10.2], 1) == pytest.approx(0.3)
+        assert compute_total_surplus_max([10.5], [3.1], 1) == pytest.approx(7.4)
+
+
+class TestSolveMarket:
+    """Test the fused equilibrium + surplus calculation."""
+
+    def test_matches_separate_calculations(self):
+        """Test that solve_market agrees with find_equilibrium + surplus."""
+        for demand, supply in [
+            ([10, 8, 6, 4], [3, 5, 7, 9]),  # partial trade
+            ([5, 3], [8, 10]),              # no trade
+            ([10, 8], [6, 7]),              # full trade
+            ([10, 8, 6], [3]),              # uneven sides
+            ([10.5, 9.0], [10.2, 9.5]),     # fractional prices
+        ]:
+            q, p = find_equilibrium(demand, supply)
+            surplus = compute_total_surplus_max(demand, supply, q)
+            
+            assert solve_market(demand, supply) == (q, p, surplus)
+
+    def test_empty_markets(self):
+        """Test that empty sides produce no trades and no surplus."""
+        assert solve_market([], []) == (0, 0.0, 0.0)
+        assert solve_market([10], []) == (0, 10.0, 0.0)
+
+
+# Legacy and segmented parameters shared by the batch tests
+BATCH_PARAMS = [
+    MarketParams(num_buyers=12, num_sellers=9, seed=3),
+    MarketParams(
+        seed=5,
+        buyer_segments=[Segment(n=6, p_min=20, p_max=40), Segment(n=4, p_min=5, p_max=25, dist="normal")],
+        seller_segments=[Segment(n=8, p_min=10, p_max=30)]
+    ),
+]
+
+
+class TestSimulateBatch:
+    """Test batched market simulation."""
+
+    @pytest.mark.parametrize("params", BATCH_PARAMS)
+    def test_matches_per_replicate_solve(self, params):
+        """Each replicate matches solve_market on the same sorted schedules."""
+        q, p, surplus = simulate_batch(params, 50)
+        demand, supply = _build_markets(params, 50)
+
+        for r in range(50):
+            assert (q[r], p[r], surplus[r]) == solve_market(demand[r], supply[r])
+
+    @pytest.mark.parametrize("params", BATCH_PARAMS)
+    def test_first_replicate_matches_single_build(self, params):
+        """Replicate 0 is the market build_buyers_and_sellers() returns."""
+        demand, supply = _build_markets(params, 5)
+        buyers, sellers = build_buyers_and_sellers(params)
+
+        assert demand[0].tolist() == buyers.tolist()
+        assert supply[0].tolist() == sellers.tolist()
+
+    def test_reproducible_with_seed(self):
+        """Test that a seeded batch is reproducible."""
+        params = MarketParams(num_buyers=8, num_sellers=8, seed=11)
+        first = simulate_batch(params, 20)
+        second = simulate_batch(params, 20)
+
+        for a, b in zip(first, second):
+            assert a.shape == (20,)
+            assert a.tolist() == b.tolist()
+
+    def test_invalid_replicate_count(self):
+        """Test that a batch needs at least one replicate."""
+        with pytest.raises(ValueError):
+            simulate_batch(MarketParams(seed=1), 0)
+
+
+class TestFindEquilibriaBatch:
+    """Test row-wise equilibrium over stacked markets."""
+
+    def test_matches_scalar_equilibrium(self):
+        """Test that each row agrees with find_equilibrium."""
+        demands = np.array([[10, 8, 6, 4], [5, 3, 2, 1], [10, 8, 7, 7]])
+        supplies = np.array([[3, 5, 7], [8, 10, 11], [6, 7, 7]])
+
+        q, p = find_equilibria_batch(demands, supplies)
+
+        for r in range(3):
+            assert (q[r], p[r]) == find_equilibrium(demands[r], supplies[r])
+
+    def test_rejects_mismatched_rows(self):
+        """Test that every market needs both a demand and a supply row."""
+        with pytest.raises(ValueError):
+            find_equilibria_batch(np.ones((2, 3)), np.ones((3, 3)))
+        with pytest.raises(ValueError):
+            find_equilibria_batch(np.ones((2, 0)), np.ones((2, 3)))
+
+
+class TestSimulateMany:
+    """Test process-parallel simulation of independent markets."""
+
+    def test_matches_serial_results(self):
+        """Test that results come back in order and match a serial run."""
+        params_list = [MarketParams(num_buyers=5 + i, num_sellers=6, seed=i) for i in range(6)]
+
+        results = simulate_many(params_list, max_workers=2)
+
+        assert results == [solve_market(*build_buyers_and_sellers(p)) for p in params_list]
+
+    def test_empty_list(self):
+        """Test that no parameters means no work."""
+        assert simulate_many([]) == []
+
 
 class TestMarketConstruction:
     """Test market building from parameters."""
@@ -115,8 +247,8 @@ class TestMarketConstruction:
         assert all(10 <= b <= 20 for b in buyers)
         assert all(5 <= s <= 15 for s in sellers)
         # Should be sorted
-        assert buyers == sorted(buyers, reverse=True)
-        assert sellers == sorted(sellers)
+        assert buyers.tolist() == sorted(buyers.tolist(), reverse=True)
+        assert sellers.tolist() == sorted(sellers.tolist())
 
     def test_segmented_parameters(self):
         """Test building market from segmented parameters."""
@@ -146,8 +278,24 @@ class TestMarketConstruction:
         buyers1, sellers1 = build_buyers_and_sellers(params)
         buyers2, sellers2 = build_buyers_and_sellers(params)
         
-        assert buyers1 == buyers2
-        assert sellers1 == sellers2
+        assert buyers1.tolist() == buyers2.tolist()
+        assert sellers1.tolist() == sellers2.tolist()
+
+    def test_sides_use_independent_streams(self):
+        """Test that resizing the sellers does not change the buyers."""
+        buyers1, _ = build_buyers_and_sellers(MarketParams(num_buyers=5, num_sellers=5, seed=42))
+        buyers2, _ = build_buyers_and_sellers(MarketParams(num_buyers=5, num_sellers=8, seed=42))
+        
+        assert buyers1.tolist() == buyers2.tolist()
+
+    def test_seeded_markets_are_cached(self):
+        """Test that seeded builds are shared and cannot be mutated."""
+        buyers1, sellers1 = build_buyers_and_sellers(MarketParams(num_buyers=5, num_sellers=5, seed=42))
+        buyers2, sellers2 = build_buyers_and_sellers(MarketParams(num_buyers=5, num_sellers=5, seed=42))
+
+        assert buyers1 is buyers2 and sellers1 is sellers2
+        with pytest.raises(ValueError):
+            buyers1[0] = 0
 
 
 class TestScheduleTable:
@@ -159,18 +307,23 @@ class TestScheduleTable:
         
         schedule = create_schedule_table(buyers)
         
-        expected = [
-            {"q": 1, "p": 10},
-            {"q": 2, "p": 8},
-            {"q": 3, "p": 6},
-            {"q": 4, "p": 4}
-        ]
+        expected = {"q": [1, 2, 3, 4], "p": [10, 8, 6, 4]}
         assert schedule == expected
 
     def test_empty_schedule(self):
         """Test empty schedule table."""
         schedule = create_schedule_table([])
-        assert schedule == []
+        assert schedule == {"q": [], "p": []}
+
+    def test_schedule_arrays_are_contiguous(self):
+        """Test schedule columns from a reversed demand view."""
+        demand = np.array([4, 6, 8, 10], dtype=np.int16)[::-1]
+
+        q, p = create_schedule_arrays(demand)
+
+        assert q.tolist() == [1, 2, 3, 4]
+        assert p.tolist() == [10, 8, 6, 4]
+        assert q.flags.c_contiguous and p.flags.c_contiguous
 
 
 class TestMarketAnalysis:
@@ -190,6 +343,17 @@ class TestMarketAnalysis:
         assert analysis["potential_trades"] == 3
         assert analysis["price_overlap"] == True  # 10 >= 4
 
+    def test_analysis_reuses_equilibrium(self):
+        """Test that a precomputed equilibrium is used as given."""
+        demand = [10, 8, 6]
+        supply = [4, 6, 8]
+        
+        # A sentinel find_equilibrium would never return
+        analysis = analyze_market_structure(demand, supply, equilibrium=(99, 1.25))
+        
+        assert analysis["equilibrium_quantity"] == 99
+        assert analysis["equilibrium_price"] == 1.25
+
 
 class TestValidation:
     """Test input validation and error handling."""
@@ -201,6 +365,62 @@ class TestValidation:
                 buyer_segments=[Segment(n=1, p_min=20, p_max=10)]
             ))
 
+    @pytest.mark.parametrize("kwargs, message", [
+        (
+            {"buyer_segments": [Segment(n=settings.max_buyers, p_min=10, p_max=20)] * 2},
+            "Total participants in buyer_segments",
+        ),
+        (
+            {"seller_segments": [Segment(n=settings.max_sellers, p_min=10, p_max=20)] * 2},
+            "Total participants in seller_segments",
+        ),
+        (
+            {
+                "buyer_segments": [Segment(n=5, p_min=10, p_max=20)],
+                "seller_segments": [Segment(n=5, p_min=30, p_max=40)],
+            },
+            "No trades possible: highest buyer max",
+        ),
+        ({"max_wtp": 20, "min_cost": 25, "max_cost": 35}, "No trades possible: max_wtp"),
+        ({"min_wtp": 20, "max_wtp": 20}, "max_wtp .* must be greater than min_wtp"),
+        ({"min_cost": 30, "max_cost": 10}, "max_cost .* must be greater than min_cost"),
+    ])
+    def test_market_params_rejected(self, kwargs, message):
+        """Test each message path of the MarketParams validator."""
+        with pytest.raises(ValueError, match=message):
+            MarketParams(**kwargs)
+
+    def test_market_params_strict_and_frozen(self):
+        """Test that unknown fields are rejected and parameters are immutable."""
+        with pytest.raises(ValueError, match="extra"):
+            MarketParams(num_buyer=5)
+        with pytest.raises(ValueError, match="frozen"):
+            MarketParams().seed = 1
+
+    def test_negative_seed_rejected(self):
+        """Test that seeds must be non-negative."""
+        with pytest.raises(ValueError, match="seed"):
+            MarketParams(seed=-1)
+        with pytest.raises(ValueError, match="seed"):
+            build_buyers(5, 10, 20, seed=-1)
+
+    def test_validate_market_inputs_accepts_arrays(self):
+        """Test that built schedules (NumPy arrays) pass validation."""
+        validate_market_inputs(*build_buyers_and_sellers(MarketParams(seed=42)))
+        validate_market_inputs([10, 9.5], [])
+
+    @pytest.mark.parametrize("demand, supply, message", [
+        (np.array([10, -1], dtype=np.int16), [5], "demand value at index 1"),
+        ([10], np.array([5.0, 6.0, -0.5]), "supply value at index 2"),
+        (np.zeros((2, 2)), [5], "1-D"),
+        ([10, "a"], [5], "demand value at index 1"),
+        ([], [], "empty"),
+    ])
+    def test_validate_market_inputs_rejects(self, demand, supply, message):
+        """Test that negative, non-numeric, non-1-D and empty inputs are rejected."""
+        with pytest.raises(ValueError, match=message):
+            validate_market_inputs(demand, supply)
+
     def test_zero_participants_in_segments(self):
         """Test handling of segments with zero participants."""
         params = MarketParams(
@@ -208,7 +428,7 @@ class TestValidation:
             seller_segments=[Segment(n=1, p_min=5, p_max=15)]
         )
         
-        with pytest.raises(ValueError, match="zero buyers"):
+        with pytest.raises(BuyersAbsentError):
             build_buyers_and_sellers(params)
 
 
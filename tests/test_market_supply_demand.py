@@ -0,0 +1,39 @@
+"""
+Unit tests for the standalone teaching script.
+
+Run with: python -m pytest tests/test_market_supply_demand.py -v
+"""
+
+import pytest
+
+from market_supply_demand import find_equilibrium
+
+
+class TestFindEquilibrium:
+    """Test the binary-search equilibrium on sorted schedules."""
+
+    @pytest.mark.parametrize("demand, supply, expected", [
+        # empty: nothing to match
+        ([], [], (0, 0.0)),
+        ([30, 20], [], (0, 0.0)),
+        # no trade: reference price between highest WTP and lowest cost
+        ([10, 8], [15, 20], (0, 12.5)),
+        # partial: the first two pairs trade
+        ([40, 30, 20, 10], [5, 15, 25, 35], (2, 22.5)),
+        # full: every pair trades, the shorter side limits Q
+        ([50, 45, 40], [10, 20, 30], (3, 35.0)),
+        ([50, 45, 40], [10, 20], (2, 32.5)),
+    ])
+    def test_case_table(self, demand, supply, expected):
+        """Test empty, no-trade, partial and full markets."""
+        assert find_equilibrium(demand, supply) == expected
+
+    def test_matches_linear_walk(self):
+        """Test that the binary search agrees with walking every pair."""
+        demand = list(range(60, 0, -3))
+        supply = list(range(5, 65, 4))
+        walked = 0
+        while walked < min(len(demand), len(supply)) and demand[walked] >= supply[walked]:
+            walked += 1
+
+        assert find_equilibrium(demand, supply)[0] == walked